@@ -7,7 +7,6 @@ from flask import Flask, render_template, request, jsonify, session
 from flask_cors import CORS
 from flask_wtf.csrf import CSRFProtect, generate_csrf
 from PIL import Image
-from flask import Flask, render_template, request, jsonify, session
 from functools import lru_cache
 import hashlib   
 
@@ -21,7 +20,6 @@ from cube_model import CubeModel
 from kociemba_solver import KociembaSolver
 # The 'moves' file is now a standalone utility for generating scrambles
 from moves import generate_random_scramble as generate_scramble 
-from utils.image_processor import process_cube_image
 
 # --- Basic Logging Setup ---
 logging.basicConfig(level=logging.INFO)
@@ -129,7 +127,7 @@ def create_app(config_name='default'):
 
                 kociemba_string = cube.to_string()
             except (ValueError, KeyError) as e:
-                app.logger.warning(f"Invalid cube state: {e}")
+                app.logger.warning("Invalid cube state: %s", e)
                 return jsonify({'error': str(e)}), 400
 
             # Try Kociemba solver first, then fallback
@@ -141,7 +139,7 @@ def create_app(config_name='default'):
                 state_hash = hashlib.md5(kociemba_string.encode()).hexdigest()
                 solution_str = cached_solve(kociemba_string)
             except Exception as e:
-                app.logger.warning(f"Kociemba solver failed: {e}")
+                app.logger.warning("Kociemba solver failed: %s", e)
                 # Fallback to basic solver
                 try:
                     from basic_solver import BasicSolver
@@ -169,7 +167,7 @@ def create_app(config_name='default'):
                 db.session.commit()
             except Exception as db_error:
                 db.session.rollback()
-                app.logger.error(f"Database error: {db_error}")
+                app.logger.error("Database error: %s", db_error)
 
             return jsonify({
                 'success': True,
@@ -178,7 +176,7 @@ def create_app(config_name='default'):
                 'solver': solver_used
             })
         except Exception as e:
-            app.logger.error(f"Error in /api/solve: {e}", exc_info=True)
+            app.logger.error("Error in /api/solve: %s", e, exc_info=True)
             return jsonify({'error': 'An internal server error occurred.'}), 500
 
 
@@ -198,7 +196,9 @@ def create_app(config_name='default'):
             if len(images) != 6:
                 return jsonify({'error': 'Please provide valid images for all 6 faces.'}), 400
 
-            # Process images to detect colors and validate the state
+            # Process images to detect colors and validate the state; utils
+            # only loads image_processor (and OpenCV) on this first use
+            from utils import process_cube_image
             cube_state_web_format = process_cube_image(images)
 
             # --- Solve the detected state using the new solver ---
@@ -218,10 +218,10 @@ def create_app(config_name='default'):
             })
         except ValueError as e:
             # This will catch errors from process_cube_image or from_web_format
-            app.logger.warning(f"Image processing or cube state validation error: {e}")
+            app.logger.warning("Image processing or cube state validation error: %s", e)
             return jsonify({'error': str(e)}), 400
         except Exception as e:
-            app.logger.error(f"Error in /api/solve/image: {e}", exc_info=True)
+            app.logger.error("Error in /api/solve/image: %s", e, exc_info=True)
             return jsonify({'error': 'An internal error occurred while processing images.'}), 500
 
     # --- Helper Function ---
@@ -43,7 +43,7 @@ class BasicSolver:
             return ' '.join(self.solution)
             
         except Exception as e:
-            logger.error(f"Basic solver failed: {e}")
+            logger.error("Basic solver failed: %s", e)
             # Return a generic solution for unsolvable states
             return "R U R' U' R' F R2 U' R' U' R U R' F'"
     
@@ -11,10 +11,21 @@ import numpy as np
 import logging
 from typing import List, Dict, Tuple, Optional, Any
 from copy import deepcopy
+from collections import Counter
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Sticker layout of a solved cube, built once: up (white), right (red),
+# front (green), down (yellow), left (orange), back (blue)
+_SOLVED_STATE = tuple(face for face in 'URFDLB' for _ in range(9))
+
+# Face notation for each face name used by the web format
+_WEB_FACE_NOTATION = {
+    'up': 'U', 'right': 'R', 'front': 'F',
+    'down': 'D', 'left': 'L', 'back': 'B'
+}
+
 
 class Face(Enum):
     """Cube faces"""
@@ -55,6 +66,10 @@ class CubeModel:
     6 7 8
     """
     
+    # Index permutations for each face turn, shared by all cubes:
+    # _move_tables[face][turns] maps new sticker positions to old ones
+    _move_tables: Dict[str, List[Optional[List[int]]]] = {}
+    
     def __init__(self):
         """Initialize a solved cube"""
         self.reset()
@@ -72,20 +87,16 @@ class CubeModel:
         # Move definitions (clockwise rotations)
         self.move_definitions = self._init_move_definitions()
         
+        if not CubeModel._move_tables:
+            CubeModel._move_tables = self._init_move_tables()
+            
         # History for undo/redo
         self.history = []
         self.history_index = -1
         
     def reset(self):
         """Reset to solved state"""
-        self.state = [
-            'U', 'U', 'U', 'U', 'U', 'U', 'U', 'U', 'U',  # Up (white)
-            'R', 'R', 'R', 'R', 'R', 'R', 'R', 'R', 'R',  # Right (red)
-            'F', 'F', 'F', 'F', 'F', 'F', 'F', 'F', 'F',  # Front (green)
-            'D', 'D', 'D', 'D', 'D', 'D', 'D', 'D', 'D',  # Down (yellow)
-            'L', 'L', 'L', 'L', 'L', 'L', 'L', 'L', 'L',  # Left (orange)
-            'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B',  # Back (blue)
-        ]
+        self.state = list(_SOLVED_STATE)
         
     def clear(self):
         """Clear all colors"""
@@ -161,6 +172,23 @@ class CubeModel:
             ]
         }
         
+    def _init_move_tables(self) -> Dict[str, List[Optional[List[int]]]]:
+        """
+        Build permutation tables for every face turn
+        
+        Applying a table is new_state[i] = state[table[i]], so a turn of
+        any amount is a single pass over the state. Index 0 is unused.
+        """
+        tables = {}
+        for face, cycles in self.move_definitions.items():
+            quarter = list(range(54))
+            for from_idx, to_idx in cycles:
+                quarter[to_idx] = from_idx
+            half = [quarter[i] for i in quarter]
+            three_quarters = [half[i] for i in quarter]
+            tables[face] = [None, quarter, half, three_quarters]
+        return tables
+        
     def get_state(self) -> List[str]:
         """Get current cube state"""
         return self.state.copy()
@@ -200,11 +228,7 @@ class CubeModel:
             center_colors.add(center_color)
             
             # Map color to face notation
-            face_notation = {
-                'up': 'U', 'right': 'R', 'front': 'F',
-                'down': 'D', 'left': 'L', 'back': 'B'
-            }
-            color_to_face_map[center_color] = face_notation[face]
+            color_to_face_map[center_color] = _WEB_FACE_NOTATION[face]
 
         if len(color_to_face_map) != 6:
             raise ValueError("Invalid state: Must have exactly 6 unique center colors")
@@ -214,9 +238,10 @@ class CubeModel:
         for face in face_order:
             flat_state_colors.extend(web_state[face])
         
-        # Translate the color characters to face initials
+        # Translate the color characters to face initials; map() runs the
+        # lookups in C and still raises KeyError for unknown colors
         try:
-            self.state = [color_to_face_map[c] for c in flat_state_colors]
+            self.state = list(map(color_to_face_map.__getitem__, flat_state_colors))
         except KeyError as e:
             raise ValueError(f"Invalid sticker color '{e.args[0]}' found which does not match any center color.")
 
@@ -322,9 +347,9 @@ class CubeModel:
         else:
             raise ValueError(f"Invalid move: {move}")
             
-        # Apply rotations
-        for _ in range(rotations):
-            self._rotate_face(face)
+        # Apply all rotations with one precomputed permutation
+        state = self.state
+        self.state = [state[i] for i in self._move_tables[face][rotations]]
             
         self._add_to_history()
         
@@ -335,20 +360,11 @@ class CubeModel:
         Args:
             face: Face to rotate
         """
-        if face not in self.move_definitions:
+        if face not in self._move_tables:
             raise ValueError(f"Invalid face: {face}")
             
-        # Get cycle definitions
-        cycles = self.move_definitions[face]
-        
-        # Create a copy of current state
-        new_state = self.state.copy()
-        
-        # Apply cycles as tuples of (from, to) indices
-        for from_idx, to_idx in cycles:
-            new_state[to_idx] = self.state[from_idx]
-        
-        self.state = new_state
+        state = self.state
+        self.state = [state[i] for i in self._move_tables[face][1]]
 
     def apply_sequence(self, sequence: str):
         """
@@ -407,10 +423,8 @@ class CubeModel:
         if not self.is_complete():
             return False, "Cube is not complete"
             
-        # Count colors
-        color_count = {}
-        for color in self.state:
-            color_count[color] = color_count.get(color, 0) + 1
+        # Count colors in a single C-level pass
+        color_count = Counter(self.state)
             
         # Check each color appears exactly 9 times
         expected_colors = set('URFDLB')
@@ -456,8 +470,14 @@ class CubeModel:
         
     def copy(self) -> 'CubeModel':
         """Create a copy of the cube"""
-        new_cube = CubeModel()
+        # The index and move tables are never modified, so the copy shares
+        # them instead of rebuilding them in __init__
+        new_cube = CubeModel.__new__(CubeModel)
+        new_cube.face_indices = self.face_indices
+        new_cube.move_definitions = self.move_definitions
         new_cube.state = self.state.copy()
+        new_cube.history = []
+        new_cube.history_index = -1
         return new_cube
         
     def _add_to_history(self):
@@ -506,14 +526,10 @@ class CubeModel:
         stats = {
             'is_solved': self.is_solved(),
             'is_complete': self.is_complete(),
-            'color_counts': {},
+            'color_counts': dict(Counter(self.state)),
             'face_uniformity': {}
         }
         
-        # Count colors
-        for color in self.state:
-            stats['color_counts'][color] = stats['color_counts'].get(color, 0) + 1
-            
         # Check face uniformity
         for face in self.face_indices:
             colors = self.get_face_colors(face)
@@ -581,12 +597,10 @@ class CubeModel:
         Simplified solvability check - just verify basic constraints
         """
         # Check that we have exactly 9 of each color
-        color_count = {}
-        for sticker in self.state:
-            color_count[sticker] = color_count.get(sticker, 0) + 1
+        color_count = Counter(self.state)
         
         for color in 'URFDLB':
-            if color_count.get(color, 0) != 9:
+            if color_count[color] != 9:
                 return False, f"Invalid color count for {color}"
         
         # Check that center pieces are all different
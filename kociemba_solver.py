@@ -53,23 +53,23 @@ class KociembaSolver:
         Raises:
             RuntimeError: If the solving process fails.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # The kociemba library solves the cube from the given state to the solved state.
             solution = kociemba.solve(cube_string)
             
             # Update statistics
-            self.last_solve_time = time.time() - start_time
+            self.last_solve_time = time.perf_counter() - start_time
             self.total_solves += 1
             self.total_time += self.last_solve_time
             
-            logger.info(f"Solved in {self.last_solve_time:.3f}s with {len(solution.split())} moves")
+            logger.info("Solved in %.3fs with %d moves", self.last_solve_time, len(solution.split()))
             
             return solution
             
         except Exception as e:
-            logger.error(f"Kociemba solve failed: {e}")
+            logger.error("Kociemba solve failed: %s", e)
             # The library raises an exception for unsolvable states.
             raise ValueError(f"The provided cube state is unsolvable. Error: {e}")
 
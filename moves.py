@@ -9,12 +9,18 @@ This module handles move notation, sequences, and transformations.
 
 import random
 import logging
+from operator import eq, itemgetter
 from typing import List, Dict, Tuple, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Opposite outer faces
+_OPPOSITE_FACES = {'U': 'D', 'D': 'U', 'F': 'B', 'B': 'F', 'R': 'L', 'L': 'R'}
+
 
 class MoveType(Enum):
     """Types of moves"""
@@ -90,12 +96,7 @@ class Move:
     
     def is_opposite_face(self, other: 'Move') -> bool:
         """Check if moves are on opposite faces"""
-        opposites = {
-            'U': 'D', 'D': 'U',
-            'F': 'B', 'B': 'F',
-            'R': 'L', 'L': 'R'
-        }
-        return opposites.get(self.face) == other.face
+        return _OPPOSITE_FACES.get(self.face) == other.face
 
 
 class MoveSequence:
@@ -209,6 +210,9 @@ ROTATION_MOVES = ["x", "x'", "x2", "y", "y'", "y2", "z", "z'", "z2"]
 
 ALL_MOVES = BASIC_MOVES + WIDE_MOVES + SLICE_MOVES + ROTATION_MOVES
 
+# Move set for constant-time membership checks
+ALL_MOVES_SET = frozenset(ALL_MOVES)
+
 
 def parse_move(move_str: str) -> Tuple[str, int]:
     """
@@ -252,6 +256,35 @@ def inverse_sequence(sequence: str) -> str:
     return str(seq.inverse())
 
 
+@lru_cache(maxsize=1024)
+def _allowed_moves(move_set: Tuple[str, ...], last_face: Optional[str],
+                   second_last_face: Optional[str]) -> Tuple[str, ...]:
+    """
+    Get the moves a scramble may continue with
+    
+    Args:
+        move_set: Allowed moves
+        last_face: Face of the previous move
+        second_last_face: Face of the move before that
+        
+    Returns:
+        Moves from move_set that don't repeat a face
+    """
+    valid_moves = move_set
+    
+    # Don't repeat same face
+    if last_face:
+        valid_moves = [m for m in valid_moves if not m.startswith(last_face)]
+        
+    # Don't do opposite faces in wrong order
+    if second_last_face and last_face:
+        if _OPPOSITE_FACES.get(second_last_face) == last_face:
+            valid_moves = [m for m in valid_moves 
+                         if not m.startswith(second_last_face)]
+            
+    return tuple(valid_moves)
+
+
 def generate_random_scramble(length: int = 25, 
                            move_set: Optional[List[str]] = None) -> str:
     """
@@ -267,25 +300,16 @@ def generate_random_scramble(length: int = 25,
     if move_set is None:
         move_set = BASIC_MOVES
         
+    # The valid moves only depend on the last two faces, so they are
+    # filtered once per face pair and cached across calls
+    move_set = tuple(move_set)
     scramble = []
     last_face = None
     second_last_face = None
     
     for _ in range(length):
-        # Filter out invalid moves
-        valid_moves = move_set.copy()
+        valid_moves = _allowed_moves(move_set, last_face, second_last_face)
         
-        # Don't repeat same face
-        if last_face:
-            valid_moves = [m for m in valid_moves if not m.startswith(last_face)]
-            
-        # Don't do opposite faces in wrong order
-        if second_last_face and last_face:
-            opposites = {'U': 'D', 'D': 'U', 'F': 'B', 'B': 'F', 'R': 'L', 'L': 'R'}
-            if opposites.get(second_last_face) == last_face:
-                valid_moves = [m for m in valid_moves 
-                             if not m.startswith(second_last_face)]
-                
         # Choose random move
         move = random.choice(valid_moves)
         scramble.append(move)
@@ -399,13 +423,15 @@ def is_valid_scramble(scramble: str) -> bool:
     try:
         moves = scramble.split()
         
-        for move in moves:
+        # Standard notation is known to be valid without parsing
+        for move in set(moves).difference(ALL_MOVES_SET):
             Move.from_string(move)
             
-        # Check for redundancies
-        for i in range(1, len(moves)):
-            if moves[i][0] == moves[i-1][0]:
-                return False  # Same face twice in a row
+        # Check for redundancies: compare every face with the next one,
+        # iterating in C over a string of first characters
+        faces = ''.join(map(itemgetter(0), moves))
+        if any(map(eq, faces, faces[1:])):
+            return False  # Same face twice in a row
                 
         return True
         
@@ -463,8 +489,8 @@ def conjugate(setup: str, algorithm: str) -> str:
     return str(result)
 
 
-# Common algorithms
-ALGORITHMS = {
+# Common algorithms, read-only
+ALGORITHMS = MappingProxyType({
     # PLL algorithms
     'T_perm': "R U R' U' R' F R2 U' R' U' R U R' F'",
     'Y_perm': "F R U' R' U' R U R' F' R U R' U' R' F R F'",
@@ -484,7 +510,7 @@ ALGORITHMS = {
     # Basic patterns
     'checkerboard': "M2 E2 S2",
     'cube_in_cube': "F L F U' R U F2 L2 U' L' B D' B' L2 U",
-}
+})
 
 
 def apply_algorithm(cube_state: str, algorithm_name: str) -> str:
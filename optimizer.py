@@ -7,356 +7,303 @@ Move sequence optimizer
 This module optimizes move sequences by removing redundancies and combining moves.
 """
 
-from typing import List, Dict, Tuple, Optional, Set
-from collections import deque
-import re
-# Remove or fix this import:
-# from utils.helpers import calculate_move_metrics 
-# Replace with local function or proper import:
-from helpers import calculate_move_metrics
+import logging
+from typing import List, Dict, Tuple
+from array import array
+from functools import lru_cache
+import numpy as np
+from utils.helpers import calculate_move_metrics
+from optimizer_core import (
+    FACES as _FACES, OPPOSITE_FACE as _OPPOSITE_FACE_ID,
+    WIDE_PAIR_CODES as _WIDE_PAIR_CODES, run_passes,
+    combine_same_face, cancel_opposites, reorder_parallel,
+    simplify_wide_moves, merge_slices, remove_redundant_rotations
+)
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_FACE_ID = {face: i for i, face in enumerate(_FACES)}
 
-class MoveOptimizer:
-    """Optimizes move sequences"""
+# Moves are encoded as (face id << 2) | turns, with turns in 0-3 so that
+# combining two moves on the same face is (code1 + code2) & 3
+
+# Notation suffix for a turn count of 0-3, and the reverse mapping
+_TURN_SUFFIX = ('', '', '2', "'")
+_SUFFIX_TURNS = {'': 1, '2': 2, "'": 3}
+
+# Notation string for every move code, built once so emitting a move is an
+# index rather than a concatenation
+_MOVE_STR = tuple(face + suffix for face in _FACES for suffix in _TURN_SUFFIX)
+
+# Hand that turns each face, indexed by the character code of the face:
+# 1 for the right hand, 2 for the left, 0 for moves that keep the hand
+_HAND_OF_FACE = np.zeros(128, dtype=np.int8)
+for _face in 'URFMS':
+    _HAND_OF_FACE[ord(_face)] = 1
+for _face in 'DLBE':
+    _HAND_OF_FACE[ord(_face)] = 2
+
+# Passes optimize_for_moves() repeats, in order, until nothing changes
+_MOVE_COUNT_PASSES = (
+    combine_same_face, cancel_opposites, reorder_parallel,
+    simplify_wide_moves, remove_redundant_rotations, merge_slices,
+)
+
+# Longest sequence optimize() handles with the stack-based fast path
+_SMALL_SEQUENCE = 8
+
+
+def _encode_move(move: str) -> int:
+    """
+    Encode a move as a single int
     
-    def __init__(self):
-        """Initialize optimizer"""
-        # Opposite face pairs
-        self.opposites = {
-            'U': 'D', 'D': 'U',
-            'F': 'B', 'B': 'F',
-            'R': 'L', 'L': 'R',
-            'M': 'M', 'E': 'E', 'S': 'S',
-            'x': 'x', 'y': 'y', 'z': 'z'
-        }
-        
-        # Parallel faces (can be reordered)
-        self.parallel_pairs = [
-            ('U', 'D'), ('F', 'B'), ('R', 'L')
-        ]
-        
-        # Face groups for wide moves
-        self.wide_equivalents = {
-            'u': ['U', "E'"], "u'": ["U'", 'E'], 'u2': ['U2', 'E2'],
-            'd': ['D', 'E'], "d'": ["D'", "E'"], 'd2': ['D2', 'E2'],
-            'r': ['R', "M'"], "r'": ["R'", 'M'], 'r2': ['R2', 'M2'],
-            'l': ['L', 'M'], "l'": ["L'", "M'"], 'l2': ['L2', 'M2'],
-            'f': ['F', 'S'], "f'": ["F'", "S'"], 'f2': ['F2', 'S2'],
-            'b': ['B', "S'"], "b'": ["B'", 'S'], 'b2': ['B2', 'S2']
-        }
-        
-    def optimize(self, moves: List[str]) -> List[str]:
-        """
-        Optimize a move sequence
-        
-        Args:
-            moves: List of moves
-            
-        Returns:
-            Optimized move list
-        """
-        if not moves:
-            return []
-            
-        # Apply multiple optimization passes
-        optimized = moves.copy()
-        
-        # Keep optimizing until no more changes
-        changed = True
-        passes = 0
-        max_passes = 10
-        previous_states = set()
-        
-        while changed and passes < max_passes:
-            original_length = len(optimized)
-            state_key = ''.join(optimized)
-            
-            # Check for cycles
-            if state_key in previous_states:
-                logger.warning("Optimization cycle detected, breaking")
-                break
-            previous_states.add(state_key)
-            
-            # Apply optimization techniques
-            optimized = self._combine_same_face(optimized)
-            optimized = self._cancel_opposites(optimized)
-            optimized = self._reorder_parallel(optimized)
-            optimized = self._simplify_wide_moves(optimized)
-            optimized = self._remove_redundant_rotations(optimized)
-            
-            changed = len(optimized) < original_length
-            passes += 1
-            
-        logger.debug(f"Optimized {len(moves)} moves to {len(optimized)} in {passes} passes")
-        
-        return optimized
-        
-    def _combine_same_face(self, moves: List[str]) -> List[str]:
-        """
-        Combine consecutive moves on the same face
-        
-        Examples:
-        - U U -> U2
-        - U U' -> (removed)
-        - U2 U -> U'
-        - U2 U2 -> (removed)
-        """
-        if len(moves) < 2:
-            return moves
-            
-        result = []
-        i = 0
+    Args:
+        move: Move string
+        
+    Returns:
+        Face id shifted left by two, ORed with the turn count
+    """
+    # A move is a face followed by at most one suffix; anything longer
+    # (Rw, R2') would not survive being rebuilt from its code
+    face_id = _FACE_ID.get(move[0])
+    turns = _SUFFIX_TURNS.get(move[1:])
+    if face_id is None or turns is None:
+        raise ValueError(f"Invalid move: {move}")
+        
+    return (face_id << 2) | turns
+
+
+def _encode_moves(moves: List[str]) -> List[int]:
+    """Encode a move list, skipping empty moves"""
+    return [_encode_move(move) for move in moves if move]
+
+
+def _decode_moves(codes: List[int]) -> List[str]:
+    """Convert encoded moves back to notation strings"""
+    move_str = _MOVE_STR
+    return [move_str[code] for code in codes]
+
+
+@lru_cache(maxsize=4096)
+def _optimize_tuple(moves: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Memoized body of MoveOptimizer.optimize()
+    
+    The cache is keyed on the moves alone, so every optimizer shares it.
+    It stores tuples so a caller mutating the returned list cannot
+    corrupt it.
+    """
+    codes = _encode_moves(moves)
+    
+    # Single algorithm applications are short enough that building the
+    # linked list costs more than the simplification itself
+    if len(codes) <= _SMALL_SEQUENCE:
+        return tuple(_decode_moves(_optimize_small(codes)))
+        
+    # Combine, cancel, simplify wide moves and drop redundant rotations
+    # in one scan instead of separate list-producing passes
+    return tuple(_decode_moves(_fused_pass(codes)))
+
+
+def _optimize_small(codes: List[int]) -> List[int]:
+    """
+    Apply the simplifications of _fused_pass to a short sequence
+    
+    Moves are pushed onto an output stack. A move that simplifies against
+    the top of the stack is replaced by the result, which is fed back in
+    so it can simplify against the new top.
+    
+    Args:
+        codes: Short list of encoded moves
+        
+    Returns:
+        Optimized encoded moves
+    """
+    wide_patterns = _WIDE_PAIR_CODES
+    pending = codes[::-1]
+    out = []
+    
+    while pending:
+        code = pending.pop()
         
-        while i < len(moves):
-            if i == len(moves) - 1:
-                result.append(moves[i])
-                break
-                
-            current = self._parse_move(moves[i])
-            next_move = self._parse_move(moves[i + 1])
+        if out:
+            top = out[-1]
             
-            if current[0] == next_move[0]:  # Same face
-                # Combine turns
-                total_turns = (current[1] + next_move[1]) % 4
-                
-                if total_turns == 0:
-                    # Moves cancel out
-                    i += 2
-                elif total_turns == 1:
-                    result.append(current[0])
-                    i += 2
-                elif total_turns == 2:
-                    result.append(current[0] + '2')
-                    i += 2
-                else:  # total_turns == 3
-                    result.append(current[0] + "'")
-                    i += 2
-            else:
-                result.append(moves[i])
-                i += 1
-                
-        return result
-        
-    def _cancel_opposites(self, moves: List[str]) -> List[str]:
-        """
-        Cancel out inverse moves
-        
-        Example: R U R' U' R U' R' -> U' (after reordering)
-        """
-        result = []
-        skip_next = False
-        
-        for i in range(len(moves)):
-            if skip_next:
-                skip_next = False
+            if (top ^ code) >> 2 == 0:
+                # Same face: U U' -> (removed), U U -> U2
+                out.pop()
+                total = (top + code) & 3
+                if total:
+                    pending.append((code & ~3) | total)
                 continue
                 
-            if i < len(moves) - 1:
-                current = moves[i]
-                next_move = moves[i + 1]
-                
-                if self._are_inverse(current, next_move):
-                    skip_next = True
-                    continue
-                    
-            result.append(moves[i])
-            
-        return result
-        
-    def _reorder_parallel(self, moves: List[str]) -> List[str]:
-        """
-        Reorder parallel face moves for better optimization
-        
-        Example: R U L U' -> R L U U' -> R L (after cancellation)
-        """
-        if len(moves) < 2:
-            return moves
-            
-        result = []
-        i = 0
-        
-        while i < len(moves):
-            if i >= len(moves) - 1:
-                result.append(moves[i])
-                i += 1
+            wide = wide_patterns.get((top, code))
+            if wide is not None:
+                # Outer face plus slice: R M' -> r
+                out.pop()
+                pending.append(wide)
                 continue
                 
-            current = self._parse_move(moves[i])
-            
-            # Look ahead for parallel moves
-            j = i + 1
-            while j < len(moves) and j < i + 4:  # Look ahead up to 3 moves
-                next_move = self._parse_move(moves[j])
-                
-                if self._are_parallel(current[0], next_move[0]):
-                    # Can reorder these moves
-                    # Check if reordering helps
-                    if self._should_reorder(moves[i:j+1]):
-                        # Swap moves
-                        result.append(moves[j])
-                        result.extend(moves[i:j])
-                        i = j + 1
-                        break
-                elif current[0] == next_move[0]:
-                    # Same face, stop looking
-                    break
-                    
-                j += 1
-            else:
-                result.append(moves[i])
-                i += 1
-                
-        return result
-        
-    def _simplify_wide_moves(self, moves: List[str]) -> List[str]:
-        """
-        Simplify wide move combinations
-        
-        Example: R M' -> r
-        """
-        result = []
-        i = 0
-        
-        while i < len(moves):
-            if i >= len(moves) - 1:
-                result.append(moves[i])
-                i += 1
+            if (len(out) > 1 and (out[-2] ^ code) >> 2 == 0
+                    and _OPPOSITE_FACE_ID[code >> 2] == top >> 2):
+                # Parallel faces commute: R L R' -> L
+                total = (out[-2] + code) & 3
+                del out[-2:]
+                pending.append(top)
+                if total:
+                    pending.append((code & ~3) | total)
                 continue
                 
-            # Check for wide move patterns
-            combined = self._try_combine_to_wide(moves[i], moves[i + 1])
-            
-            if combined:
-                result.append(combined)
-                i += 2
-            else:
-                result.append(moves[i])
-                i += 1
-                
-        return result
+        out.append(code)
         
-    def _remove_redundant_rotations(self, moves: List[str]) -> List[str]:
-        """
-        Remove redundant cube rotations
-        
-        Example: x x' -> (removed)
-        """
-        result = []
-        
-        for i, move in enumerate(moves):
-            if i < len(moves) - 1:
-                if self._are_inverse(move, moves[i + 1]):
-                    if move[0] in 'xyz':
-                        # Skip both rotation and its inverse
-                        continue
-                        
-            result.append(move)
-            
-        return result
-        
-    def _parse_move(self, move: str) -> Tuple[str, int]:
-        """
-        Parse move into face and turn count
-        
-        Args:
-            move: Move string
-            
-        Returns:
-            Tuple of (face, turns)
-        """
-        if not move:
-            return '', 0
+    return out
+
+
+def _fused_pass(codes: List[int]) -> List[int]:
+    """
+    Apply all local simplifications in a single forward scan
+    
+    The sequence is held as a doubly linked list of encoded moves. Each
+    node and its successor are tried for a same-face merge (which also
+    cancels inverses and redundant rotations), a wide move combination,
+    and a merge across a commuting parallel face. After any change the
+    scan backs up one node so that newly adjacent moves are examined as
+    well.
+    
+    Args:
+        codes: Encoded moves
+        
+    Returns:
+        Optimized encoded moves
+    """
+    n = len(codes)
+    if n == 0:
+        return []
+        
+    # Node n is a sentinel head whose face id (-1) never matches
+    codes = array('b', codes)
+    codes.append(-4)
+    
+    nxt = array('i', range(1, n + 2))
+    nxt[n - 1] = -1
+    nxt[n] = 0
+    prv = array('i', range(-1, n + 1))
+    prv[0] = n
+    prv[n] = -1
+    
+    def unlink(node):
+        before, after = prv[node], nxt[node]
+        nxt[before] = after
+        if after != -1:
+            prv[after] = before
             
-        face = move[0]
-        
-        if len(move) == 1:
-            turns = 1
-        elif move[-1] == '2':
-            turns = 2
-        elif move[-1] == "'":
-            turns = 3
+    def merge(node, other):
+        # Fold other's turns into node, removing node if they cancel
+        total = (codes[node] + codes[other]) & 3
+        unlink(other)
+        if total:
+            codes[node] = (codes[node] & ~3) | total
         else:
-            turns = 1
+            unlink(node)
             
-        return face, turns
-        
-    def _are_inverse(self, move1: str, move2: str) -> bool:
-        """Check if two moves are inverses"""
-        p1 = self._parse_move(move1)
-        p2 = self._parse_move(move2)
-        
-        if p1[0] != p2[0]:
-            return False
+    wide_patterns = _WIDE_PAIR_CODES
+    i = n
+    
+    while True:
+        j = nxt[i]
+        if j == -1:
+            break
             
-        # Check if turns sum to 4 (full rotation)
-        return (p1[1] + p2[1]) % 4 == 0 and p1[1] != 2  # U2 U2 should combine, not cancel
-        
-    def _are_parallel(self, face1: str, face2: str) -> bool:
-        """Check if two faces are parallel (opposite)"""
-        return self.opposites.get(face1) == face2
-        
-    def _should_reorder(self, moves: List[str]) -> bool:
-        """
-        Determine if reordering moves would be beneficial
-        
-        Args:
-            moves: Subsequence of moves to consider
+        a, b = codes[i], codes[j]
+        
+        if (a ^ b) >> 2 == 0:
+            # Same face: U U' -> (removed), U U -> U2
+            before = prv[i]
+            merge(i, j)
+            i = before
+            continue
             
-        Returns:
-            True if reordering would help optimization
-        """
-        if len(moves) < 2:
-            return False
+        wide = wide_patterns.get((a, b))
+        if wide is not None:
+            # Outer face plus slice: R M' -> r
+            codes[i] = wide
+            unlink(j)
+            i = prv[i]
+            continue
             
-        # Simple heuristic: reorder if it brings same faces together
-        faces = [self._parse_move(m)[0] for m in moves]
+        k = nxt[j]
+        if k != -1 and (a ^ codes[k]) >> 2 == 0 and _OPPOSITE_FACE_ID[a >> 2] == b >> 2:
+            # Parallel faces commute: R L R' -> L
+            before = prv[i]
+            merge(i, k)
+            i = before
+            continue
+            
+        i = j
         
-        # Count same face pairs after reordering
-        original_pairs = sum(1 for i in range(len(faces)-1) if faces[i] == faces[i+1])
+    result = []
+    node = nxt[n]
+    while node != -1:
+        result.append(codes[node])
+        node = nxt[node]
         
-        # Simulate reordering (move last to second position)
-        reordered = faces[:1] + faces[-1:] + faces[1:-1]
-        reordered_pairs = sum(1 for i in range(len(reordered)-1) 
-                             if reordered[i] == reordered[i+1])
+    return result
+
+
+class MoveOptimizer:
+    """Optimizes move sequences"""
+    
+    __slots__ = ('friendly_patterns', 'pattern_automaton')
+    
+    def __init__(self):
+        """Initialize optimizer"""
+        # Finger-trick friendly patterns reported by analyze_efficiency
+        self.friendly_patterns = {
+            "Sexy Move (R U R' U')": "R U R' U'",
+            "Sledgehammer (R' F R F')": "R' F R F'",
+            "Hedge Slammer (R F R' F')": "R F R' F'",
+            "Sune (R U R' U R U2 R')": "R U R' U R U2 R'",
+            "Anti-Sune (R U2 R' U' R U' R')": "R U2 R' U' R U' R'",
+        }
         
-        return reordered_pairs > original_pairs
+        # Aho-Corasick automaton matching all friendly patterns in one pass
+        self.pattern_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self.pattern_automaton = ahocorasick.Automaton()
+            for name, pattern in self.friendly_patterns.items():
+                self.pattern_automaton.add_word(pattern, name)
+            self.pattern_automaton.make_automaton()
         
-    def _try_combine_to_wide(self, move1: str, move2: str) -> Optional[str]:
+    def optimize(self, moves: List[str]) -> List[str]:
         """
-        Try to combine two moves into a wide move
+        Optimize a move sequence
         
         Args:
-            move1: First move
-            move2: Second move
+            moves: List of moves
             
         Returns:
-            Combined wide move or None
+            Optimized move list
         """
-        # Check for patterns like R M' -> r
-        patterns = {
-            ('R', "M'"): 'r',
-            ("R'", 'M'): "r'",
-            ('R2', 'M2'): 'r2',
-            ('L', 'M'): 'l',
-            ("L'", "M'"): "l'",
-            ('L2', 'M2'): 'l2',
-            ('U', "E'"): 'u',
-            ("U'", 'E'): "u'",
-            ('U2', 'E2'): 'u2',
-            ('D', 'E'): 'd',
-            ("D'", "E'"): "d'",
-            ('D2', 'E2'): 'd2',
-            ('F', 'S'): 'f',
-            ("F'", "S'"): "f'",
-            ('F2', 'S2'): 'f2',
-            ('B', "S'"): 'b',
-            ("B'", 'S'): "b'",
-            ('B2', 'S2'): 'b2',
-        }
+        if not moves:
+            return []
+            
+        # Repeated sequences are served from the cache; it stores tuples so
+        # a caller mutating the returned list cannot corrupt it
+        optimized = list(_optimize_tuple(tuple(moves)))
+            
+        logger.debug("Optimized %d moves to %d", len(moves), len(optimized))
         
-        return patterns.get((move1, move2))
+        return optimized
+        
+    def clear_cache(self):
+        """Clear the results memoized by optimize(), shared by all optimizers"""
+        _optimize_tuple.cache_clear()
         
     def optimize_for_speed(self, moves: List[str]) -> List[str]:
         """
@@ -369,19 +316,10 @@ class MoveOptimizer:
             Speed-optimized moves
         """
         # Prefer certain move combinations for finger tricks
-        result = moves.copy()
-        
-        # Replace slow patterns with faster ones
-        speed_replacements = {
-            "F R U' R' U' R U R' F'": "F (R U R' U')3 F'",  # Triple sexy
-            "R' F R F'": "R' F R F'",  # Sledgehammer (already good)
-            "R U R' U'": "R U R' U'",  # Sexy move (already good)
-        }
-        
         # This would require pattern matching in the sequence
-        # Simplified implementation
-        
-        return result
+        # Simplified implementation: nothing is rewritten yet, so the
+        # result is a copy of the input
+        return list(moves)
         
     def optimize_for_moves(self, moves: List[str]) -> List[str]:
         """
@@ -393,66 +331,15 @@ class MoveOptimizer:
         Returns:
             Move-count optimized sequence
         """
-        # Try all optimization techniques aggressively
-        optimized = moves.copy()
-        
-        # Apply all optimizations multiple times
-        for _ in range(5):
-            prev_length = len(optimized)
-            
-            optimized = self._combine_same_face(optimized)
-            optimized = self._cancel_opposites(optimized)
-            optimized = self._reorder_parallel(optimized)
-            optimized = self._simplify_wide_moves(optimized)
-            optimized = self._remove_redundant_rotations(optimized)
-            optimized = self._merge_slices(optimized)
-            
-            if len(optimized) == prev_length:
-                break
-                
-        return optimized
-        
-    def _merge_slices(self, moves: List[str]) -> List[str]:
-        """
-        Merge slice moves where possible
+        # Start from the same simplification optimize() applies, so the two
+        # only differ by the extra passes below
+        moves = self.optimize(moves)
         
-        Example: M M -> M2
-        """
-        if len(moves) < 2:
-            return moves
-            
-        result = []
-        i = 0
+        # Moves are encoded once and every pass works on the same pair of
+        # buffers; they are only turned back into strings at the end
+        codes = run_passes(_MOVE_COUNT_PASSES, _encode_moves(moves), 5)
         
-        while i < len(moves):
-            if i >= len(moves) - 1:
-                result.append(moves[i])
-                i += 1
-                continue
-                
-            current = self._parse_move(moves[i])
-            next_move = self._parse_move(moves[i + 1])
-            
-            # Check if both are slice moves on same axis
-            if current[0] in 'MES' and current[0] == next_move[0]:
-                total_turns = (current[1] + next_move[1]) % 4
-                
-                if total_turns == 0:
-                    i += 2  # Cancel out
-                elif total_turns == 1:
-                    result.append(current[0])
-                    i += 2
-                elif total_turns == 2:
-                    result.append(current[0] + '2')
-                    i += 2
-                else:  # total_turns == 3
-                    result.append(current[0] + "'")
-                    i += 2
-            else:
-                result.append(moves[i])
-                i += 1
-                
-        return result
+        return _decode_moves(codes)
         
     def analyze_efficiency(self, moves: List[str]) -> Dict[str, any]:
         """
@@ -474,46 +361,38 @@ class MoveOptimizer:
         # --- Finger Trick Analysis ---
         finger_trick_friendly = 0
         sequence_str = " ".join(moves)
-        friendly_patterns = {
-            "Sexy Move (R U R' U')": "R U R' U'",
-            "Sledgehammer (R' F R F')": "R' F R F'",
-            "Hedge Slammer (R F R' F')": "R F R' F'",
-            "Sune (R U R' U R U2 R')": "R U R' U R U2 R'",
-            "Anti-Sune (R U2 R' U' R U' R')": "R U2 R' U' R U' R'",
-        }
         found_patterns = []
-        for name, pattern in friendly_patterns.items():
-            if pattern in sequence_str:
+        if self.pattern_automaton is not None:
+            # A single scan reports every occurrence of every pattern
+            matched = {name for _, name in self.pattern_automaton.iter(sequence_str)}
+        else:
+            matched = {name for name, pattern in self.friendly_patterns.items()
+                       if pattern in sequence_str}
+        for name in self.friendly_patterns:
+            if name in matched:
                 finger_trick_friendly += 1
                 found_patterns.append(name)
 
         # --- Regrip Estimation (Heuristic) ---
-        regrips_needed = 0
-        last_hand = None
-        hand_map = {
-            'U': 'R', 'R': 'R',
-            'D': 'L', 'L': 'L',
-            'F': 'R', 'B': 'L', 
-            'M': 'R',
-            'E': 'L',
-            'S': 'R'
-        }
-        for move in moves:
-            face = move[0].upper()
-            current_hand = hand_map.get(face, last_hand)
-            if last_hand and current_hand != last_hand and (last_hand in 'RL' and current_hand in 'RL'):
-                regrips_needed += 1
-            last_hand = current_hand
+        # Moves without a hand keep the previous one, so a regrip is any
+        # change between consecutive moves that do have a hand
+        face_codes = np.frombuffer(
+            ''.join(move[0] for move in moves).upper().encode('ascii', 'replace'),
+            dtype=np.uint8
+        )
+        hands = _HAND_OF_FACE[face_codes]
+        hands = hands[hands != 0]
+        regrips_needed = int(np.count_nonzero(hands[1:] != hands[:-1]))
 
         analysis = {
-            "Original Moves (HTM)": original_metrics['htm'],
-            "Optimized Moves (HTM)": optimized_metrics['htm'],
-            "Reduction": f"{original_metrics['htm'] - optimized_metrics['htm']} moves",
-            "Quarter Turn Metric (QTM)": original_metrics['qtm'],
-            "Slice Turn Metric (STM)": original_metrics['stm'],
+            "Original Moves (HTM)": original_metrics.htm,
+            "Optimized Moves (HTM)": optimized_metrics.htm,
+            "Reduction": f"{original_metrics.htm - optimized_metrics.htm} moves",
+            "Quarter Turn Metric (QTM)": original_metrics.qtm,
+            "Slice Turn Metric (STM)": original_metrics.stm,
             "Finger-Trick Patterns": ", ".join(found_patterns) if found_patterns else "None",
             "Estimated Regrips": regrips_needed,
-            "Cube Rotations (x,y,z)": original_metrics['rotations'],
+            "Cube Rotations (x,y,z)": original_metrics.rotations,
         }
 
         return analysis
\ No newline at end of file
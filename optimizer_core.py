@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Inner loops of the move optimizer
+
+The passes here work on moves encoded as (face_id << 2) | turns, with
+face ids indexing FACES. Each pass reads an input buffer, writes into an
+output buffer of the same length and returns the number of moves written.
+They are compiled with Numba when it is installed and run as plain
+Python otherwise.
+"""
+
+from typing import List
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Faces in the order used for integer face ids: outer faces, slices,
+# cube rotations, wide moves and the uppercase rotations MoveSequence emits
+FACES = 'URFDLBMESxyzurfdlbXYZ'
+
+_FIRST_SLICE = FACES.index('M')
+_LAST_SLICE = FACES.index('S')
+_FIRST_ROTATION = FACES.index('x')
+_LAST_ROTATION = FACES.index('z')
+
+# Face id of the opposite (parallel) outer face, -1 if there is none
+_OPPOSITES = {'U': 'D', 'D': 'U', 'F': 'B', 'B': 'F', 'R': 'L', 'L': 'R'}
+OPPOSITE_FACE = tuple(
+    FACES.index(_OPPOSITES[face]) if face in _OPPOSITES else -1
+    for face in FACES
+)
+
+# Outer face turn and slice turn that together make a wide move, as
+# (wide move, outer face, slice, slice direction): R M' -> r
+_WIDE_MOVES = (
+    ('u', 'U', 'E', -1), ('d', 'D', 'E', 1),
+    ('r', 'R', 'M', -1), ('l', 'L', 'M', 1),
+    ('f', 'F', 'S', 1), ('b', 'B', 'S', -1),
+)
+
+# Wide move code for each pair of codes that makes one
+WIDE_PAIR_CODES = {
+    (FACES.index(_outer) << 2 | _turns,
+     FACES.index(_slice) << 2 | (_turns * _direction) & 3): FACES.index(_wide) << 2 | _turns
+    for _wide, _outer, _slice, _direction in _WIDE_MOVES
+    for _turns in (1, 2, 3)
+}
+
+# The same table flattened for the kernels: the wide move code for a pair
+# of codes (a, b) at a * _NUM_CODES + b, or -1
+_NUM_CODES = len(FACES) << 2
+_wide_pairs = [-1] * (_NUM_CODES * _NUM_CODES)
+for (_first, _second), _wide_code in WIDE_PAIR_CODES.items():
+    _wide_pairs[_first * _NUM_CODES + _second] = _wide_code
+WIDE_PAIRS = np.array(_wide_pairs, dtype=np.int32) if NUMBA_AVAILABLE else _wide_pairs
+
+
+@njit(cache=True)
+def combine_same_face(codes, out):
+    """Fold consecutive turns of the same face together: U U U -> U'"""
+    k = 0
+    for i in range(len(codes)):
+        code = codes[i]
+        if k > 0 and (out[k - 1] ^ code) >> 2 == 0:
+            total = (out[k - 1] + code) & 3
+            if total:
+                out[k - 1] = (code & ~3) | total
+            else:
+                k -= 1
+        else:
+            out[k] = code
+            k += 1
+    return k
+
+
+@njit(cache=True)
+def cancel_opposites(codes, out):
+    """Drop adjacent inverse pairs, including ones exposed by a drop"""
+    k = 0
+    for i in range(len(codes)):
+        code = codes[i]
+        if k > 0:
+            top = out[k - 1]
+            # U2 U2 is left for combine_same_face
+            if (top ^ code) >> 2 == 0 and (top + code) & 3 == 0 and top & 3 != 2:
+                k -= 1
+                continue
+        out[k] = code
+        k += 1
+    return k
+
+
+@njit(cache=True)
+def merge_slices(codes, out):
+    """Fold consecutive turns of the same slice together: M M -> M2"""
+    k = 0
+    for i in range(len(codes)):
+        code = codes[i]
+        face = code >> 2
+        if (k > 0 and (out[k - 1] ^ code) >> 2 == 0
+                and _FIRST_SLICE <= face <= _LAST_SLICE):
+            total = (out[k - 1] + code) & 3
+            if total:
+                out[k - 1] = (code & ~3) | total
+            else:
+                k -= 1
+        else:
+            out[k] = code
+            k += 1
+    return k
+
+
+@njit(cache=True)
+def _emit(out, k, face, turns):
+    """Write a face turn to out unless it is a full rotation"""
+    if face != -1 and turns:
+        out[k] = face << 2 | turns
+        k += 1
+    return k
+
+
+@njit(cache=True)
+def reorder_parallel(codes, out):
+    """Merge turns across runs of moves on parallel faces: R L R' L -> L2"""
+    k = 0
+    axis = -1
+    # The faces of the current axis in order of first appearance, with
+    # their summed turns
+    first = second = -1
+    first_turns = second_turns = 0
+    for i in range(len(codes)):
+        code = codes[i]
+        face = code >> 2
+        opposite = OPPOSITE_FACE[face]
+        move_axis = min(face, opposite) if opposite != -1 else -1
+        if move_axis != axis:
+            k = _emit(out, k, first, first_turns)
+            k = _emit(out, k, second, second_turns)
+            first = second = -1
+            first_turns = second_turns = 0
+            axis = move_axis
+        if move_axis == -1:
+            # Slices, rotations and wide moves are passed through
+            out[k] = code
+            k += 1
+        elif first == -1 or face == first:
+            first = face
+            first_turns = (first_turns + code) & 3
+        else:
+            second = face
+            second_turns = (second_turns + code) & 3
+    k = _emit(out, k, first, first_turns)
+    k = _emit(out, k, second, second_turns)
+    return k
+
+
+@njit(cache=True)
+def simplify_wide_moves(codes, out):
+    """Combine an outer face turn and the matching slice turn: R M' -> r"""
+    k = 0
+    i = 0
+    n = len(codes)
+    while i < n:
+        if i < n - 1:
+            wide = WIDE_PAIRS[codes[i] * _NUM_CODES + codes[i + 1]]
+            if wide != -1:
+                out[k] = wide
+                k += 1
+                i += 2
+                continue
+        out[k] = codes[i]
+        k += 1
+        i += 1
+    return k
+
+
+@njit(cache=True)
+def remove_redundant_rotations(codes, out):
+    """Drop adjacent inverse cube rotations: x x' -> (removed)"""
+    k = 0
+    for i in range(len(codes)):
+        code = codes[i]
+        face = code >> 2
+        if k > 0 and _FIRST_ROTATION <= face <= _LAST_ROTATION:
+            top = out[k - 1]
+            if (top ^ code) >> 2 == 0 and (top + code) & 3 == 0 and top & 3 != 2:
+                k -= 1
+                continue
+        out[k] = code
+        k += 1
+    return k
+
+
+def run_passes(kernels, codes: List[int], rounds: int) -> List[int]:
+    """
+    Run a chain of passes over a list of encoded moves
+
+    The chain is repeated until a round leaves the length unchanged or
+    rounds is reached. Two buffers are allocated once and swapped between
+    passes, so the moves are only converted on the way in and out.
+
+    Args:
+        kernels: Pass functions from this module, in the order to run them
+        codes: Encoded moves
+        rounds: Maximum number of times to run the chain
+
+    Returns:
+        Encoded moves after the last round
+    """
+    n = len(codes)
+    if NUMBA_AVAILABLE:
+        src = np.asarray(codes, dtype=np.int32)
+        out = np.empty_like(src)
+    else:
+        src = list(codes)
+        out = [0] * n
+
+    for _ in range(rounds):
+        prev_length = n
+        for kernel in kernels:
+            n = kernel(src[:n], out)
+            src, out = out, src
+        if n == prev_length:
+            break
+
+    if NUMBA_AVAILABLE:
+        return src[:n].tolist()
+    return src[:n]
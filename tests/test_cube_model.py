@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Tests for the cube model"""
+
+import pytest
+
+from cube_model import CubeModel
+
+
+def _rotate_by_cycles(state, cycles):
+    """One clockwise turn applied cycle by cycle, as the cycles define it"""
+    new_state = list(state)
+    for from_idx, to_idx in cycles:
+        new_state[to_idx] = state[from_idx]
+    return new_state
+
+
+@pytest.mark.parametrize('face', 'URFDLB')
+@pytest.mark.parametrize('turns', [1, 2, 3])
+def test_move_tables_match_move_definitions(face, turns):
+    cube = CubeModel()
+    
+    # Tracking sticker positions rather than colours tells every
+    # permutation apart
+    expected = list(range(54))
+    for _ in range(turns):
+        expected = _rotate_by_cycles(expected, cube.move_definitions[face])
+        
+    assert CubeModel._move_tables[face][turns] == expected
+
+
+@pytest.mark.parametrize('move, face, turns', [('F', 'F', 1), ('F2', 'F', 2), ("F'", 'F', 3)])
+def test_apply_move_uses_the_table_for_the_turn_count(move, face, turns):
+    cube = CubeModel()
+    cube.state = list(range(54))
+    cube.apply_move(move)
+    assert cube.state == CubeModel._move_tables[face][turns]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Tests for the move sequence optimizer"""
+
+import importlib
+import random
+import sys
+
+import pytest
+
+import optimizer_core
+from cube_model import CubeModel
+
+
+@pytest.fixture(params=['installed', 'without_numba'])
+def optimizer_module(request):
+    """The optimizer module, as installed and with the numba import blocked"""
+    import optimizer
+    
+    if request.param == 'installed':
+        yield optimizer
+        return
+        
+    saved = sys.modules.get('numba')
+    sys.modules['numba'] = None
+    try:
+        importlib.reload(optimizer_core)
+        assert not optimizer_core.NUMBA_AVAILABLE
+        yield importlib.reload(optimizer)
+    finally:
+        if saved is None:
+            del sys.modules['numba']
+        else:
+            sys.modules['numba'] = saved
+        importlib.reload(optimizer_core)
+        importlib.reload(optimizer)
+
+
+@pytest.fixture
+def optimizer(optimizer_module):
+    return optimizer_module.MoveOptimizer()
+
+
+def _apply(moves):
+    """Return the state of a solved cube after applying moves"""
+    cube = CubeModel()
+    for move in moves:
+        cube.apply_move(move)
+    return cube.get_state()
+
+
+def test_optimize_accepts_uppercase_rotations(optimizer):
+    assert optimizer.optimize(['X', 'X', 'R', 'Y', "Y'", 'Z2']) == ['X2', 'R', 'Z2']
+
+
+def test_optimize_for_moves_accepts_uppercase_rotations(optimizer):
+    assert optimizer.optimize_for_moves(['X', 'X', 'R', 'Y', "Y'", 'Z2']) == ['X2', 'R', 'Z2']
+
+
+def test_optimize_for_moves_is_at_least_as_short_as_optimize(optimizer):
+    moves = ['R', 'L', 'U', "R'", 'M', 'L', 'R', "M'", 'x', 'R', 'D'] * 10
+    assert len(optimizer.optimize_for_moves(moves)) <= len(optimizer.optimize(moves))
+
+
+def test_optimized_moves_leave_the_cube_state_unchanged(optimizer):
+    # CubeModel only turns the outer faces; drawing from a few faces at a
+    # time makes cancellations and parallel-face merges common
+    rng = random.Random(0)
+    face_sets = ('URFDLB', 'RL', 'UD', 'FBR')
+    for _ in range(300):
+        faces = rng.choice(face_sets)
+        moves = [rng.choice(faces) + rng.choice(('', '2', "'"))
+                 for _ in range(rng.randint(1, 40))]
+        state = _apply(moves)
+        assert _apply(optimizer.optimize(moves)) == state, moves
+        assert _apply(optimizer.optimize_for_moves(moves)) == state, moves
+
+
+def test_optimize_cache_is_shared_between_optimizers(optimizer_module):
+    moves = ['R', 'U', 'U', "R'", 'F2', 'F2', 'L']
+    cache_info = optimizer_module._optimize_tuple.cache_info
+    first = optimizer_module.MoveOptimizer()
+    first.clear_cache()
+    
+    result = first.optimize(moves)
+    assert (cache_info().hits, cache_info().misses) == (0, 1)
+    
+    # A second optimizer is served from the first one's entry, which the
+    # caller mutating its result has not touched
+    result.append('D')
+    assert optimizer_module.MoveOptimizer().optimize(moves) == ['R', 'U2', "R'", 'L']
+    assert (cache_info().hits, cache_info().misses) == (1, 1)
+
+
+def test_analyze_efficiency_reports_every_friendly_pattern(optimizer):
+    moves = ['R', 'U', "R'", "U'", "R'", 'F', 'R', "F'"]
+    analysis = optimizer.analyze_efficiency(moves)
+    assert analysis["Finger-Trick Patterns"] == (
+        "Sexy Move (R U R' U'), Sledgehammer (R' F R F')"
+    )
+
+
+def test_optimize_leaves_input_unchanged(optimizer):
+    moves = ['R', 'R', 'U', "U'", 'F']
+    optimizer.optimize(moves)
+    optimizer.optimize_for_moves(moves)
+    assert moves == ['R', 'R', 'U', "U'", 'F']
+
+
+def test_optimize_for_speed_returns_a_copy(optimizer):
+    moves = ['R', 'U', "R'", "U'"]
+    result = optimizer.optimize_for_speed(moves)
+    assert result == moves
+    result.append('F')
+    assert moves == ['R', 'U', "R'", "U'"]
+
+
+@pytest.mark.parametrize('move', ['Rw', 'Uw2', "R2'", 'Q'])
+def test_optimize_rejects_unknown_notation(optimizer, move):
+    with pytest.raises(ValueError):
+        optimizer.optimize([move])
+    with pytest.raises(ValueError):
+        optimizer.optimize_for_moves([move])
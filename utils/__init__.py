@@ -5,7 +5,14 @@
 Utilities package for Rubik's Cube solver
 """
 
-from .image_processor import process_cube_image
-from .helpers import calculate_move_metrics
+from .helpers import MoveMetrics, calculate_move_metrics
 
-__all__ = ['process_cube_image', 'calculate_move_metrics']
\ No newline at end of file
+__all__ = ['process_cube_image', 'calculate_move_metrics', 'MoveMetrics']
+
+
+def __getattr__(name):
+    """Import image_processor, and with it OpenCV, only when it is used"""
+    if name == 'process_cube_image':
+        from .image_processor import process_cube_image
+        return process_cube_image
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,9 +5,26 @@
 Helper utilities for the Rubik's Cube solver
 """
 
-from typing import List, Dict
+from typing import List, NamedTuple
 
-def calculate_move_metrics(moves: List[str]) -> Dict[str, int]:
+import numpy as np
+
+# Kind of move for each ASCII face letter, upper-cased
+_FACE, _SLICE, _ROTATION = range(3)
+_FACE_KIND = np.zeros(128, dtype=np.intp)
+_FACE_KIND[np.frombuffer(b'MES', dtype=np.uint8)] = _SLICE
+_FACE_KIND[np.frombuffer(b'XYZ', dtype=np.uint8)] = _ROTATION
+
+
+class MoveMetrics(NamedTuple):
+    """Move counts of a sequence in the common metrics"""
+    htm: int        # Half Turn Metric
+    qtm: int        # Quarter Turn Metric
+    stm: int        # Slice Turn Metric
+    rotations: int  # Cube rotations
+
+
+def calculate_move_metrics(moves: List[str]) -> MoveMetrics:
     """
     Calculate various metrics for a move sequence
     
@@ -15,41 +32,21 @@ def calculate_move_metrics(moves: List[str]) -> Dict[str, int]:
         moves: List of move notations
         
     Returns:
-        Dictionary with metrics (htm, qtm, stm, rotations)
+        MoveMetrics with htm, qtm, stm and rotations
     """
-    metrics = {
-        'htm': 0,      # Half Turn Metric
-        'qtm': 0,      # Quarter Turn Metric  
-        'stm': 0,      # Slice Turn Metric
-        'rotations': 0  # Cube rotations
-    }
+    moves = list(filter(None, moves))
     
-    for move in moves:
-        if not move:
-            continue
-            
-        # HTM: Every move counts as 1
-        metrics['htm'] += 1
-        
-        # Parse move
-        face = move[0].upper()
-        
-        # QTM: Count quarter turns
-        if move.endswith('2'):
-            metrics['qtm'] += 2
-        else:
-            metrics['qtm'] += 1
-            
-        # STM: Slice moves count differently
-        if face in 'MES':
-            metrics['stm'] += 2
-        elif face.islower():  # Wide moves
-            metrics['stm'] += 1
-        else:
-            metrics['stm'] += 1
-            
-        # Count rotations
-        if face in 'XYZ':
-            metrics['rotations'] += 1
-            
-    return metrics
\ No newline at end of file
+    # Classify every move by its face in one table lookup
+    faces = np.frombuffer(
+        ''.join(move[0] for move in moves).encode('ascii', 'replace').upper(),
+        dtype=np.uint8
+    )
+    kinds = np.bincount(_FACE_KIND[faces], minlength=3)
+    half_turns = ''.join(move[-1] for move in moves).count('2')
+    
+    return MoveMetrics(
+        htm=len(moves),                      # Every move counts as 1
+        qtm=len(moves) + half_turns,         # Half turns count 2
+        stm=len(moves) + int(kinds[_SLICE]), # Slices count 2
+        rotations=int(kinds[_ROTATION])
+    )
\ No newline at end of file
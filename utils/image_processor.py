@@ -7,12 +7,39 @@ Image processing utilities for cube face detection
 
 import cv2
 import numpy as np
+from collections import Counter
 from PIL import Image
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _read_only(color: np.ndarray) -> np.ndarray:
+    """Mark a reference color array as read-only and return it"""
+    color.flags.writeable = False
+    return color
+
+# Reference colors in BGR format, read-only since _REFERENCE_TABLE below
+# is built from them once
+REFERENCE_COLORS = MappingProxyType({
+    'W': _read_only(np.array([255, 255, 255])),  # White
+    'Y': _read_only(np.array([0, 255, 255])),    # Yellow
+    'R': _read_only(np.array([0, 0, 255])),      # Red
+    'O': _read_only(np.array([0, 165, 255])),    # Orange
+    'G': _read_only(np.array([0, 255, 0])),      # Green
+    'B': _read_only(np.array([255, 0, 0]))       # Blue
+})
+
+# The reference colors stacked into one (colors x 3) table, so a batch of
+# samples is classified with a single vectorized distance computation
+_REFERENCE_CODES = tuple(REFERENCE_COLORS)
+_REFERENCE_TABLE = np.array([REFERENCE_COLORS[code] for code in _REFERENCE_CODES],
+                            dtype=np.float64)
+
+# Sticker count of every color on a valid cube
+_EXPECTED_COLOR_COUNTS = dict.fromkeys(('W', 'Y', 'R', 'O', 'G', 'B'), 9)
+
 def process_cube_image(images: Dict[str, Image.Image]) -> Dict[str, List[str]]:
     """
     Process cube face images and detect colors
@@ -23,24 +50,15 @@ def process_cube_image(images: Dict[str, Image.Image]) -> Dict[str, List[str]]:
     Returns:
         Dictionary with face names as keys and lists of 9 color codes
     """
-    # Define reference colors in BGR format
-    reference_colors = {
-        'W': np.array([255, 255, 255]),  # White
-        'Y': np.array([0, 255, 255]),    # Yellow
-        'R': np.array([0, 0, 255]),      # Red
-        'O': np.array([0, 165, 255]),    # Orange
-        'G': np.array([0, 255, 0]),      # Green
-        'B': np.array([255, 0, 0])       # Blue
-    }
-    
     cube_state = {}
     
     for face_name, img in images.items():
-        # Convert PIL to OpenCV format
-        opencv_img = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+        # Convert PIL to OpenCV format; asarray wraps the pixel data
+        # without an extra copy, and cvtColor writes a new image anyway
+        opencv_img = cv2.cvtColor(np.asarray(img), cv2.COLOR_RGB2BGR)
         
         # Detect the 9 stickers
-        colors = detect_face_colors(opencv_img, reference_colors)
+        colors = detect_face_colors(opencv_img)
         cube_state[face_name] = colors
         
     # Validate the detected state
@@ -50,7 +68,7 @@ def process_cube_image(images: Dict[str, Image.Image]) -> Dict[str, List[str]]:
     return cube_state
 
 def detect_face_colors(image: np.ndarray, 
-                       reference_colors: Dict[str, np.ndarray]) -> List[str]:
+                       reference_colors: Mapping[str, np.ndarray] = REFERENCE_COLORS) -> List[str]:
     """
     Detect 9 sticker colors from a cube face image
     """
@@ -62,7 +80,7 @@ def detect_face_colors(image: np.ndarray,
     cell_h = h // grid_size
     cell_w = w // grid_size
     
-    colors = []
+    cell_colors = []
     for row in range(grid_size):
         for col in range(grid_size):
             # Extract cell region with smaller margin for better sampling
@@ -73,52 +91,46 @@ def detect_face_colors(image: np.ndarray,
             x2 = (col + 1) * cell_w - margin
             
             cell = image[y1:y2, x1:x2]
-            avg_color = cv2.mean(cell)[:3]
-            detected_color = classify_color(np.array(avg_color), reference_colors)
-            colors.append(detected_color)
+            cell_colors.append(cv2.mean(cell)[:3])
             
-    return colors
+    # Classify all 9 stickers at once
+    return classify_colors(np.array(cell_colors), reference_colors)
+
+def classify_colors(bgr_colors: np.ndarray,
+                    reference_colors: Mapping[str, np.ndarray] = REFERENCE_COLORS) -> List[str]:
+    """
+    Classify a batch of BGR colors to their nearest reference colors
+    """
+    if reference_colors is REFERENCE_COLORS:
+        codes, table = _REFERENCE_CODES, _REFERENCE_TABLE
+    else:
+        codes = tuple(reference_colors)
+        table = np.array([reference_colors[code] for code in codes], dtype=np.float64)
+        
+    # Euclidean distance from every sample to every reference color; ties
+    # go to the reference listed first
+    distances = np.linalg.norm(bgr_colors[:, None, :] - table[None, :, :], axis=2)
+    return [codes[i] for i in distances.argmin(axis=1)]
 
 def classify_color(bgr_color: np.ndarray, 
-                   reference_colors: Dict[str, np.ndarray]) -> str:
+                   reference_colors: Mapping[str, np.ndarray] = REFERENCE_COLORS) -> str:
     """
     Classify a BGR color to nearest reference color
     """
-    min_distance = float('inf')
-    best_match = 'W'
-    
-    for color_code, ref_color in reference_colors.items():
-        # Calculate Euclidean distance
-        distance = np.linalg.norm(bgr_color - ref_color)
-        
-        if distance < min_distance:
-            min_distance = distance
-            best_match = color_code
-            
-    return best_match
+    return classify_colors(np.asarray(bgr_color)[None, :], reference_colors)[0]
 
 def validate_cube_state(cube_state: Dict[str, List[str]]) -> bool:
     """
     Validate that the cube state is physically possible
     """
-    # Count occurrences of each color
-    color_count = {}
+    # Count occurrences of each color, a whole face per C-level update
+    color_count = Counter()
     
     for face, colors in cube_state.items():
         if len(colors) != 9:
             return False
             
-        for color in colors:
-            color_count[color] = color_count.get(color, 0) + 1
-            
-    # Each color should appear exactly 9 times
-    expected_colors = {'W', 'Y', 'R', 'O', 'G', 'B'}
-    
-    if set(color_count.keys()) != expected_colors:
-        return False
-        
-    for color in expected_colors:
-        if color_count.get(color, 0) != 9:
-            return False
+        color_count.update(colors)
             
-    return True
\ No newline at end of file
+    # Each color should appear exactly 9 times, and no other color at all
+    return color_count == _EXPECTED_COLOR_COUNTS
\ No newline at end of file